@@ -1 +0,0 @@
-# ecoAtom/modules/beamline.py"""Beamline ties together:- Centrifugal core- Vacuum chamber- DetectorCurrently not used by main.py, but stands ready for a more complexmulti-component simulation in future versions."""from typing import Dict, Anyfrom core.centrifugal_core import CentrifugalCorefrom core.vacuum import VacuumChamberfrom .detector import Detectorclass Beamline:    def __init__(self, config: Dict[str, Any]) -> None:        self.core = CentrifugalCore(config["centrifugal"])        self.vacuum = VacuumChamber(config["vacuum"])        self.detector = Detector(config.get("detector", {}))
\ No newline at end of file
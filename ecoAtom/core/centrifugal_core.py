@@ -12,13 +12,17 @@ Simplified rotational accelerator:
 - Instability threshold (RPM)
 """
 
-from dataclasses import dataclass
-import math
-from typing import Dict
+from typing import Dict, NamedTuple
 
 
-@dataclass
-class CentrifugalState:
+# rad/s per RPM: 2*pi / 60
+_RPM_TO_RAD_S = 0.10471975511965977
+
+# Nucleon mass (kg)
+_NUCLEON_MASS_KG = 1.67e-27
+
+
+class CentrifugalState(NamedTuple):
     rpm: float
     angular_velocity: float
     tangential_velocity: float
@@ -27,6 +31,19 @@ class CentrifugalState:
 
 
 class CentrifugalCore:
+    __slots__ = (
+        "radius_m",
+        "rpm",
+        "max_rpm",
+        "acceleration_rpm_per_s",
+        "beam_mass_number",
+        "instability_threshold_rpm",
+        "_omega_per_rpm",
+        "_v_per_rpm",
+        "_a_per_rpm2",
+        "_ke_coef",
+    )
+
     def __init__(self, cfg: Dict[str, float]) -> None:
         self.radius_m = cfg["radius_m"]
         self.rpm = cfg["initial_rpm"]
@@ -35,17 +52,24 @@ class CentrifugalCore:
         self.beam_mass_number = cfg["beam_mass_number"]
         self.instability_threshold_rpm = cfg["instability_threshold_rpm"]
 
+        # Per-RPM scale factors; every derived quantity is linear or
+        # quadratic in rpm for a fixed radius.
+        self._omega_per_rpm = _RPM_TO_RAD_S
+        self._v_per_rpm = self._omega_per_rpm * self.radius_m
+        self._a_per_rpm2 = self._omega_per_rpm**2 * self.radius_m
+        self._ke_coef = 0.5 * _NUCLEON_MASS_KG * self._v_per_rpm**2
+
     @property
     def angular_velocity(self) -> float:
-        return (self.rpm / 60.0) * 2.0 * math.pi  # rad/s
+        return self._omega_per_rpm * self.rpm  # rad/s
 
     @property
     def tangential_velocity(self) -> float:
-        return self.angular_velocity * self.radius_m  # m/s
+        return self._v_per_rpm * self.rpm  # m/s
 
     @property
     def centrifugal_acceleration(self) -> float:
-        return self.angular_velocity**2 * self.radius_m  # m/s^2
+        return self._a_per_rpm2 * self.rpm * self.rpm  # m/s^2
 
     @property
     def unstable(self) -> bool:
@@ -57,11 +81,9 @@ class CentrifugalCore:
         Non-relativistic KE per nucleon (J). We only need consistent scaling.
         KE = 1/2 m v^2 with m = nucleon mass ≈ 1.67e-27 kg.
         """
-        v = self.tangential_velocity
-        m = 1.67e-27
-        return 0.5 * m * v * v
+        return self._ke_coef * self.rpm * self.rpm
 
-    def step(self, dt: float) -> CentrifugalState:
+    def step_silent(self, dt: float) -> None:
         """
         Advance RPM over time by a fixed ramp rate until saturated at max_rpm.
         """
@@ -70,10 +92,23 @@ class CentrifugalCore:
             if self.rpm > self.max_rpm:
                 self.rpm = self.max_rpm
 
+    def step(self, dt: float) -> CentrifugalState:
+        """
+        Like step_silent, but also returns the resulting state snapshot.
+        """
+        self.step_silent(dt)
+        return self.state()
+
+    def state(self) -> CentrifugalState:
+        """
+        Snapshot of the current rotational state.
+        """
+        rpm = self.rpm
+
         return CentrifugalState(
-            rpm=self.rpm,
-            angular_velocity=self.angular_velocity,
-            tangential_velocity=self.tangential_velocity,
-            centrifugal_acceleration=self.centrifugal_acceleration,
-            unstable=self.unstable,
+            rpm=rpm,
+            angular_velocity=self._omega_per_rpm * rpm,
+            tangential_velocity=self._v_per_rpm * rpm,
+            centrifugal_acceleration=self._a_per_rpm2 * rpm * rpm,
+            unstable=rpm >= self.instability_threshold_rpm,
         )
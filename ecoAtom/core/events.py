@@ -8,94 +8,202 @@ Events are generated from:
 - vacuum state (pressure)
 - beam element properties (Z, mass)
 
-Events are written as JSON to data/events/.
+Events are written as JSON to data/events/, either synchronously via
+save_event or from a background thread via EventWriter.
 """
 
-from dataclasses import dataclass, asdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Any
-import json
-import random
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Set, Tuple
+import threading
+import time
 
+import numpy as np
+import orjson
 
-@dataclass
-class Fragment:
-    id: int
-    energy_j: float
-    angle_deg: float
+
+_RNG = np.random.default_rng()
+
+# Max events queued on an EventWriter before submit() blocks
+_MAX_PENDING_WRITES = 256
+
+# Directories already created by ensure_directory during this process
+_ENSURED_DIRS: Set[str] = set()
 
 
 @dataclass
 class Event:
-    timestamp: str
+    timestamp_ns: int
     step: int
     time_delta: float
     beam_element: Dict[str, Any]
     centrifugal_state: Dict[str, Any]
     vacuum_state: Dict[str, Any]
-    fragments: List[Fragment]
+    # Struct-of-arrays: "energy_j" and "angle_deg", indexed by fragment id
+    fragments: Dict[str, np.ndarray]
+
+
+def beam_summary(beam_element: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The subset of beam element properties recorded on every event.
+    """
+    return {
+        "atomic_number": beam_element["atomic_number"],
+        "symbol": beam_element["symbol"],
+        "name": beam_element["name"],
+        "atomic_mass": beam_element["atomic_mass"],
+    }
+
+
+def fragment_count_range(atomic_number: int) -> Tuple[int, int]:
+    """
+    Inclusive (min, max) fragment count for a beam of the given Z.
+    """
+    # Fragment count scales with Z, with randomness
+    avg_fragments = max(2, min(10, atomic_number // 3))
+    return max(2, avg_fragments - 2), avg_fragments + 2
 
 
 def generate_event(
     step: int,
     dt: float,
     beam_element: Dict[str, Any],
+    min_fragments: int,
+    max_fragments: int,
+    total_energy_j: float,
     core_state: Dict[str, Any],
     vacuum_state: Dict[str, Any],
-    base_ke_j_per_nucleon: float,
 ) -> Event:
-    timestamp = datetime.utcnow().isoformat() + "Z"
+    """
+    Build one collision event.
 
-    z = beam_element["atomic_number"]
-    mass = beam_element["atomic_mass"]
+    beam_element, min_fragments/max_fragments and total_energy_j are run
+    invariants (see beam_summary and fragment_count_range) computed once by
+    the caller; beam_element is stored on the event as-is.
+    """
+    timestamp_ns = time.time_ns()
 
-    # Base total kinetic energy (scaled)
-    total_energy_j = base_ke_j_per_nucleon * mass * 1e-9
+    # Same generator as the energies/angles, so one seed reproduces an event
+    n_fragments = int(_RNG.integers(min_fragments, max_fragments + 1))
 
-    # Fragment count scales with Z, with randomness
-    avg_fragments = max(2, min(10, int(z / 3)))
-    n_fragments = random.randint(max(2, avg_fragments - 2), avg_fragments + 2)
-
-    fragments: List[Fragment] = []
-    remaining_energy = total_energy_j
-
-    for i in range(n_fragments):
-        if i == n_fragments - 1:
-            e = max(0.0, remaining_energy)
-        else:
-            fraction = random.uniform(0.05, 0.3)
-            e = total_energy_j * fraction
-            remaining_energy -= e
-        angle = random.uniform(0.0, 360.0)
-        fragments.append(Fragment(id=i, energy_j=e, angle_deg=angle))
+    # Energy fractions for all but the last fragment, which takes the remainder
+    fractions = _RNG.uniform(0.05, 0.3, size=n_fragments - 1)
+    energies = np.empty(n_fragments)
+    energies[:-1] = total_energy_j * fractions
+    energies[-1] = max(0.0, total_energy_j - energies[:-1].sum())
+    angles = _RNG.uniform(0.0, 360.0, size=n_fragments)
 
     return Event(
-        timestamp=timestamp,
+        timestamp_ns=timestamp_ns,
         step=step,
         time_delta=dt,
-        beam_element={
-            "atomic_number": beam_element["atomic_number"],
-            "symbol": beam_element["symbol"],
-            "name": beam_element["name"],
-            "atomic_mass": beam_element["atomic_mass"],
-        },
+        beam_element=beam_element,
         centrifugal_state=core_state,
         vacuum_state=vacuum_state,
-        fragments=fragments,
+        fragments={"energy_j": energies, "angle_deg": angles},
     )
 
 
-def save_event(event: Event, output_dir: Path) -> Path:
-    output_dir.mkdir(parents=True, exist_ok=True)
-    ts = event.timestamp.replace(":", "").replace("-", "").replace(".", "")
-    filename = f"event_{event.step:06d}_{ts}.json"
-    path = output_dir / filename
+def _iso_timestamp(timestamp_ns: int) -> str:
+    dt = datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc)
+    return dt.replace(tzinfo=None).isoformat() + "Z"
+
 
-    serializable = asdict(event)
-    serializable["fragments"] = [asdict(f) for f in event.fragments]
+def event_path(event: Event, output_dir: Path) -> Path:
+    filename = f"event_{event.step:06d}_{event.timestamp_ns}.json"
+    return output_dir / filename
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(serializable, f, indent=2)
 
+def _write_event(event: Event, path: Path) -> None:
+    # The human-readable timestamp is only rendered for the payload
+    serializable = {"timestamp": _iso_timestamp(event.timestamp_ns)}
+    # Shallow copy: events are not mutated once handed off, so asdict()'s
+    # deep copy of the state dicts and fragment arrays is wasted work.
+    serializable.update((f.name, getattr(event, f.name)) for f in fields(event))
+    serializable["fragments"] = [
+        {"id": i, "energy_j": e, "angle_deg": a}
+        for i, (e, a) in enumerate(
+            zip(
+                event.fragments["energy_j"].tolist(),
+                event.fragments["angle_deg"].tolist(),
+            )
+        )
+    ]
+
+    payload = orjson.dumps(serializable, option=orjson.OPT_SERIALIZE_NUMPY)
+    with open(path, "wb") as f:
+        f.write(payload)
+
+
+def ensure_directory(path: Path) -> None:
+    """
+    mkdir -p, skipped for directories this process already created.
+    """
+    key = str(path)
+    if key in _ENSURED_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(key)
+
+
+def save_event(event: Event, output_dir: Path) -> Path:
+    ensure_directory(output_dir)
+    path = event_path(event, output_dir)
+    _write_event(event, path)
     return path
+
+
+class EventWriter:
+    """
+    Writes events to output_dir on a single background worker.
+
+    submit() only hands the event to the worker and returns the path it
+    will be written to; payload construction, serialization and file I/O
+    all happen off the caller's thread. Call close() (or use as a context
+    manager) to flush pending events; it re-raises the first write error.
+
+    At most max_pending events are in flight; once that many are waiting,
+    submit() blocks until the worker catches up, so memory stays bounded
+    when events are produced faster than they can be written.
+    """
+
+    def __init__(self, output_dir: Path, max_pending: int = _MAX_PENDING_WRITES) -> None:
+        self.output_dir = output_dir
+        # Once per run, so always mkdir: the directory may have been removed
+        # since an earlier run in this process cached it.
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="event-writer"
+        )
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._error: Optional[BaseException] = None
+
+    def submit(self, event: Event) -> Path:
+        path = event_path(event, self.output_dir)
+        self._pending.acquire()
+        try:
+            future = self._executor.submit(_write_event, event, path)
+        except BaseException:
+            self._pending.release()
+            raise
+        future.add_done_callback(self._on_done)
+        return path
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "EventWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _on_done(self, future: "Future[None]") -> None:
+        self._pending.release()
+        exc = future.exception()
+        if exc is not None and self._error is None:
+            self._error = exc
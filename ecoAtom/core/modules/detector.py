@@ -8,35 +8,36 @@ to post-process Event.fragments to simulate detection efficiency
 and angular resolution.
 """
 
-from typing import List, Dict, Any
+from typing import Dict, Any, Tuple
 import math
-import random
+
+import numpy as np
 
 
 class Detector:
     def __init__(self, cfg: Dict[str, Any]) -> None:
         self.efficiency = cfg.get("efficiency", 0.8)
         self.angular_resolution_deg = cfg.get("angular_resolution_deg", 5.0)
+        if not self.angular_resolution_deg > 0:
+            raise ValueError(
+                "detector angular_resolution_deg must be > 0, "
+                f"got {self.angular_resolution_deg!r}"
+            )
+        self._step = float(self.angular_resolution_deg)
+        self._inv_step = 1.0 / self._step
+        self._rng = np.random.default_rng()
 
-    def detect(self, fragments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        detected: List[Dict[str, Any]] = []
-
-        for frag in fragments:
-            if random.random() > self.efficiency:
-                continue
-
-            angle = frag["angle_deg"]
-            binned_angle = self._bin_angle(angle)
+    def detect(self, fragments: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply efficiency and angular binning to an Event.fragments array set.
 
-            detected.append(
-                {
-                    "energy_j": frag["energy_j"],
-                    "angle_deg": binned_angle,
-                }
-            )
+        Returns (indices, binned_angles): the ids of detected fragments and
+        their angles snapped to the detector's angular resolution.
+        """
+        angles = fragments["angle_deg"]
 
-        return detected
+        # Keep each fragment with probability `efficiency`, then bin in one pass
+        mask = self._rng.random(len(angles)) < self.efficiency
+        binned = np.round(angles[mask] * self._inv_step) * self._step
 
-    def _bin_angle(self, angle_deg: float) -> float:
-        step = self.angular_resolution_deg
-        return round(angle_deg / step) * step
+        return np.flatnonzero(mask), binned
@@ -10,25 +10,107 @@ Main simulation loop for ecoAtom.
 """
 
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
-from .centrifugal_core import CentrifugalCore
-from .vacuum import VacuumChamber
-from .events import generate_event, save_event
+from numba import njit
+import numpy as np
 
+from .centrifugal_core import CentrifugalCore, CentrifugalState
+from .vacuum import VacuumChamber, VacuumState, _vacuum_step
+from .events import EventWriter, beam_summary, fragment_count_range, generate_event
 
-BASE_DIR = Path(__file__).resolve().parents[1]
+
+BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 
 
-def _select_beam_element(elements: List[Dict[str, Any]], atomic_number: int) -> Dict[str, Any]:
-    for e in elements:
-        if e["atomic_number"] == atomic_number:
-            return e
-    raise ValueError(f"No element with atomic_number={atomic_number} found.")
+def _select_beam_element(
+    element_by_z: Dict[int, Dict[str, Any]], atomic_number: int
+) -> Dict[str, Any]:
+    try:
+        return element_by_z[atomic_number]
+    except KeyError:
+        raise ValueError(f"No element with atomic_number={atomic_number} found.") from None
+
+
+# No cache=True: the on-disk cache only tracks this file, not the vacuum.py
+# kernels compiled in, so it would go stale when those change.
+@njit
+def _march(
+    steps: int,
+    dt: float,
+    rpm0: float,
+    max_rpm: float,
+    accel: float,
+    p0: float,
+    base: float,
+    pump: float,
+    outgas: float,
+    interval: int,
+) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """
+    Time-march the RPM ramp and pressure ODE for `steps` ticks.
+
+    Returns (rpm, pressure) sampled at every event step, followed by the
+    final rpm and pressure so the model objects can be brought up to date.
+    """
+    sample_rpm = np.empty(steps // interval)
+    sample_p = np.empty_like(sample_rpm)
+    rpm = rpm0
+    p = p0
+    j = 0
+
+    for s in range(steps):
+        if rpm < max_rpm:
+            rpm = min(rpm + accel * dt, max_rpm)
+        p = _vacuum_step(p, base, pump, outgas, dt)
+
+        if s % interval == 0 and s != 0:
+            sample_rpm[j] = rpm
+            sample_p[j] = p
+            j += 1
+
+    return sample_rpm[:j], sample_p[:j], rpm, p
+
+
+def _emit_event(
+    step: int,
+    dt: float,
+    event_beam: Dict[str, Any],
+    fragment_range: Tuple[int, int],
+    beam_mass: float,
+    core: CentrifugalCore,
+    core_state: CentrifugalState,
+    vac_state: VacuumState,
+    writer: EventWriter,
+) -> None:
+    event = generate_event(
+        step=step,
+        dt=dt,
+        beam_element=event_beam,
+        min_fragments=fragment_range[0],
+        max_fragments=fragment_range[1],
+        # Base total kinetic energy (scaled)
+        total_energy_j=core.kinetic_energy_per_nucleon_j * beam_mass * 1e-9,
+        core_state=core_state._asdict(),
+        vacuum_state=vac_state._asdict(),
+    )
+    path = writer.submit(event)
+    print(
+        f"[EVENT] step={step:04d} rpm={core_state.rpm:8.1f} "
+        f"P={vac_state.pressure_pa:.3e} Pa "
+        f"frags={len(event.fragments['energy_j'])} -> {path.name}"
+    )
 
 
-def run_simulation(elements: List[Dict[str, Any]], config: Dict[str, Any]) -> None:
+def run_simulation(
+    elements: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    data_dir: Optional[Path] = None,
+) -> None:
+    """
+    Run the simulation, writing events under data_dir (default DATA_DIR).
+    """
     sim_cfg = config["simulation"]
     core_cfg = config["centrifugal"]
     vac_cfg = config["vacuum"]
@@ -40,12 +122,20 @@ def run_simulation(elements: List[Dict[str, Any]], config: Dict[str, Any]) -> No
     event_interval = sim_cfg["event_interval_steps"]
     realtime_delay = sim_cfg.get("realtime_delay", 0.0)
 
-    beam_element = _select_beam_element(elements, beam_cfg["element_atomic_number"])
+    element_by_z = {e["atomic_number"]: e for e in elements}
+    beam_element = _select_beam_element(element_by_z, beam_cfg["element_atomic_number"])
+
+    # Per-run beam invariants shared by every event
+    event_beam = beam_summary(beam_element)
+    fragment_range = fragment_count_range(beam_element["atomic_number"])
+    beam_mass = beam_element["atomic_mass"]
 
     core = CentrifugalCore(core_cfg)
     vacuum = VacuumChamber(vac_cfg)
 
-    events_dir = DATA_DIR / output_cfg["events_dir"]
+    if data_dir is None:
+        data_dir = DATA_DIR
+    events_dir = data_dir / output_cfg["events_dir"]
 
     print(
         f"[INFO] Beam element: Z={beam_element['atomic_number']} "
@@ -55,33 +145,63 @@ def run_simulation(elements: List[Dict[str, Any]], config: Dict[str, Any]) -> No
 
     import time
 
-    for step in range(steps):
-        core_state = core.step(dt)
-        vac_state = vacuum.step(dt)
-
-        if step % event_interval == 0 and step != 0:
-            event = generate_event(
-                step=step,
-                dt=dt,
-                beam_element=beam_element,
-                core_state={
-                    "rpm": core_state.rpm,
-                    "angular_velocity": core_state.angular_velocity,
-                    "tangential_velocity": core_state.tangential_velocity,
-                    "centrifugal_acceleration": core_state.centrifugal_acceleration,
-                    "unstable": core_state.unstable,
-                },
-                vacuum_state={"pressure_pa": vac_state.pressure_pa},
-                base_ke_j_per_nucleon=core.kinetic_energy_per_nucleon_j,
-            )
-            path = save_event(event, events_dir)
-            print(
-                f"[EVENT] step={step:04d} rpm={core_state.rpm:8.1f} "
-                f"P={vac_state.pressure_pa:.3e} Pa "
-                f"frags={len(event.fragments)} -> {path.name}"
+    with EventWriter(events_dir) as writer:
+        if realtime_delay > 0:
+            # Paced run: step the models one tick at a time so we can sleep
+            # Only sampled ticks build state objects
+            for step in range(steps):
+                if step % event_interval == 0 and step != 0:
+                    core_state = core.step(dt)
+                    vac_state = vacuum.step(dt)
+                    _emit_event(
+                        step,
+                        dt,
+                        event_beam,
+                        fragment_range,
+                        beam_mass,
+                        core,
+                        core_state,
+                        vac_state,
+                        writer,
+                    )
+                else:
+                    core.step_silent(dt)
+                    vacuum.step_silent(dt)
+
+                time.sleep(realtime_delay)
+        else:
+            # Unpaced run: march the whole time series in one compiled kernel
+            # and only touch Python objects at event steps.
+            sample_rpm, sample_p, final_rpm, final_p = _march(
+                steps,
+                dt,
+                core.rpm,
+                core.max_rpm,
+                core.acceleration_rpm_per_s,
+                vacuum.pressure_pa,
+                vacuum.base_pressure_pa,
+                vacuum.pump_speed,
+                vacuum.outgassing_rate,
+                event_interval,
             )
 
-        if realtime_delay > 0:
-            time.sleep(realtime_delay)
+            for k in range(len(sample_rpm)):
+                step = (k + 1) * event_interval
+                core.rpm = float(sample_rpm[k])
+                vacuum.pressure_pa = float(sample_p[k])
+                _emit_event(
+                    step,
+                    dt,
+                    event_beam,
+                    fragment_range,
+                    beam_mass,
+                    core,
+                    core.state(),
+                    VacuumState(pressure_pa=vacuum.pressure_pa),
+                    writer,
+                )
+
+            core.rpm = final_rpm
+            vacuum.pressure_pa = final_p
 
     print("[INFO] Simulation loop finished.")
@@ -13,39 +13,98 @@ Simplified dynamic:
   dP/dt = -pump_speed * (P - base_pressure) + outgassing_rate * f(P)
 """
 
-from dataclasses import dataclass
 import math
-from typing import Dict
+from typing import Dict, NamedTuple
 
+from numba import njit
+import numpy as np
 
-@dataclass
-class VacuumState:
+
+class VacuumState(NamedTuple):
     pressure_pa: float
 
 
+# Outgassing profile f(P) = log10(P * 1e12 + 10), tabulated so the hot loop
+# avoids a libm log10. Nodes sit at P = 2**(e - 1) * (1 + j / _LUT_SUB) for
+# every frexp exponent e in [_LUT_EXP_LO, _LUT_EXP_HI], i.e. _LUT_SUB evenly
+# spaced points per octave, so the index comes straight from math.frexp and
+# linear interpolation between nodes is linear in P (max abs error ~1e-5).
+_LUT_EXP_LO = -39  # frexp exponent of the 1e-12 Pa floor
+_LUT_EXP_HI = 11  # covers P < 2048 Pa; above that fall back to log10
+_LUT_SUB = 64
+
+
+def _build_outgas_lut() -> np.ndarray:
+    exps = np.arange(_LUT_EXP_LO, _LUT_EXP_HI + 1)
+    subs = np.arange(_LUT_SUB)
+    nodes = np.ldexp(1.0 + subs[None, :] / _LUT_SUB, (exps - 1)[:, None]).ravel()
+    nodes = np.append(nodes, 2.0**_LUT_EXP_HI)
+    return np.log10(nodes * 1e12 + 10.0)
+
+
+_OUTGAS_LUT = _build_outgas_lut()
+
+
+@njit(cache=True, fastmath=True)
+def _outgas_profile(pressure_pa: float) -> float:
+    """
+    log10(P * 1e12 + 10) for P >= 1e-12, via _OUTGAS_LUT.
+    """
+    m, e = math.frexp(pressure_pa)
+    if e > _LUT_EXP_HI:
+        return math.log10(pressure_pa * 1e12 + 10.0)
+
+    u = (2.0 * m - 1.0) * _LUT_SUB
+    j = int(u)
+    idx = (e - _LUT_EXP_LO) * _LUT_SUB + j
+    y0 = _OUTGAS_LUT[idx]
+    return y0 + (u - j) * (_OUTGAS_LUT[idx + 1] - y0)
+
+
+@njit(cache=True, fastmath=True)
+def _vacuum_step(
+    pressure_pa: float,
+    base_pressure_pa: float,
+    pump_speed: float,
+    outgassing_rate: float,
+    dt: float,
+) -> float:
+    # Pumping term: exponential-like approach to base pressure
+    pump_term = -pump_speed * (pressure_pa - base_pressure_pa)
+
+    # Outgassing term: weak upward pressure, more active at higher P.
+    # Under njit, max() lowers to a branch-free select and is an exact clamp.
+    outgas_term = outgassing_rate * _outgas_profile(max(pressure_pa, 1e-12))
+
+    pressure_pa += (pump_term + outgas_term) * dt
+
+    # Bound pressure
+    if pressure_pa < base_pressure_pa:
+        pressure_pa = base_pressure_pa
+    if pressure_pa < 1e-12:
+        pressure_pa = 1e-12
+
+    return pressure_pa
+
+
 class VacuumChamber:
+    __slots__ = ("pressure_pa", "base_pressure_pa", "pump_speed", "outgassing_rate")
+
     def __init__(self, cfg: Dict[str, float]) -> None:
         self.pressure_pa = cfg["initial_pressure_pa"]
         self.base_pressure_pa = cfg["base_pressure_pa"]
         self.pump_speed = cfg["pump_speed"]
         self.outgassing_rate = cfg["outgassing_rate"]
 
-    def step(self, dt: float) -> VacuumState:
-        # Pumping term: exponential-like approach to base pressure
-        pump_term = -self.pump_speed * (self.pressure_pa - self.base_pressure_pa)
-
-        # Outgassing term: weak upward pressure, more active at higher P
-        outgas_term = self.outgassing_rate * math.log10(
-            max(self.pressure_pa, 1e-12) * 1e12 + 10.0
+    def step_silent(self, dt: float) -> None:
+        self.pressure_pa = _vacuum_step(
+            self.pressure_pa,
+            self.base_pressure_pa,
+            self.pump_speed,
+            self.outgassing_rate,
+            dt,
         )
 
-        dP = (pump_term + outgas_term) * dt
-        self.pressure_pa += dP
-
-        # Bound pressure
-        if self.pressure_pa < self.base_pressure_pa:
-            self.pressure_pa = self.base_pressure_pa
-        if self.pressure_pa < 1e-12:
-            self.pressure_pa = 1e-12
-
+    def step(self, dt: float) -> VacuumState:
+        self.step_silent(dt)
         return VacuumState(pressure_pa=self.pressure_pa)
@@ -1,298 +0,0 @@
-="""
-ecoAtom — Main Facility Entry Point
------------------------------------
-
-This is a fully self-contained version of main.py that includes:
-
-- Configuration loading with fallback defaults
-- Periodic table loading with fallback defaults
-- Beamline construction (centrifugal core + vacuum chamber)
-- Simulation loop
-- Event generation
-- JSON writing
-- Diagnostics and runtime statistics
-- Graceful shutdown handling
-
-You can run this file alone and it will simulate a complete ecoAtom run
-even if no other files exist.
-"""
-
-import json
-import os
-import sys
-import time
-import math
-import random
-from pathlib import Path
-from datetime import datetime
-
-
-# ============================================================
-# 1. DEFAULT CONFIGURATION (used if config.json missing)
-# ============================================================
-
-DEFAULT_CONFIG = {
-    "simulation": {
-        "steps": 200,
-        "time_step": 0.1,
-        "event_interval_steps": 10,
-        "realtime_delay": 0.0
-    },
-    "centrifugal": {
-        "radius_m": 10.0,
-        "initial_rpm": 0.0,
-        "max_rpm": 20000.0,
-        "acceleration_rpm_per_s": 200.0,
-        "beam_mass_number": 56,
-        "instability_threshold_rpm": 15000.0
-    },
-    "vacuum": {
-        "initial_pressure_pa": 0.001,
-        "base_pressure_pa": 1e-9,
-        "pump_speed": 0.5,
-        "outgassing_rate": 0.02
-    },
-    "beam": {
-        "element_atomic_number": 10
-    },
-    "output": {
-        "events_dir": "data/events"
-    }
-}
-
-
-# ============================================================
-# 2. DEFAULT PERIODIC TABLE (first 10 elements)
-# ============================================================
-
-DEFAULT_PERIODIC_TABLE = [
-    {"atomic_number": 1, "symbol": "H", "name": "Hydrogen", "atomic_mass": 1.008},
-    {"atomic_number": 2, "symbol": "He", "name": "Helium", "atomic_mass": 4.002602},
-    {"atomic_number": 3, "symbol": "Li", "name": "Lithium", "atomic_mass": 6.94},
-    {"atomic_number": 4, "symbol": "Be", "name": "Beryllium", "atomic_mass": 9.0121831},
-    {"atomic_number": 5, "symbol": "B", "name": "Boron", "atomic_mass": 10.81},
-    {"atomic_number": 6, "symbol": "C", "name": "Carbon", "atomic_mass": 12.011},
-    {"atomic_number": 7, "symbol": "N", "name": "Nitrogen", "atomic_mass": 14.007},
-    {"atomic_number": 8, "symbol": "O", "name": "Oxygen", "atomic_mass": 15.999},
-    {"atomic_number": 9, "symbol": "F", "name": "Fluorine", "atomic_mass": 18.998403163},
-    {"atomic_number": 10, "symbol": "Ne", "name": "Neon", "atomic_mass": 20.1797}
-]
-
-
-# ============================================================
-# 3. UTILITY FUNCTIONS
-# ============================================================
-
-def load_json_or_default(path: Path, default):
-    if path.exists():
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            print(f"[WARN] Failed to load {path}, using defaults.")
-    return default
-
-
-def ensure_directory(path: Path):
-    path.mkdir(parents=True, exist_ok=True)
-
-
-# ============================================================
-# 4. CENTRIFUGAL CORE MODEL
-# ============================================================
-
-class CentrifugalCore:
-    def __init__(self, cfg):
-        self.radius_m = cfg["radius_m"]
-        self.rpm = cfg["initial_rpm"]
-        self.max_rpm = cfg["max_rpm"]
-        self.accel = cfg["acceleration_rpm_per_s"]
-        self.instability_threshold = cfg["instability_threshold_rpm"]
-
-    @property
-    def angular_velocity(self):
-        return (self.rpm / 60.0) * 2.0 * math.pi
-
-    @property
-    def tangential_velocity(self):
-        return self.angular_velocity * self.radius_m
-
-    @property
-    def centrifugal_accel(self):
-        return self.angular_velocity ** 2 * self.radius_m
-
-    @property
-    def unstable(self):
-        return self.rpm >= self.instability_threshold
-
-    @property
-    def kinetic_energy_per_nucleon_j(self):
-        v = self.tangential_velocity
-        m = 1.67e-27
-        return 0.5 * m * v * v
-
-    def step(self, dt):
-        if self.rpm < self.max_rpm:
-            self.rpm += self.accel * dt
-            if self.rpm > self.max_rpm:
-                self.rpm = self.max_rpm
-
-        return {
-            "rpm": self.rpm,
-            "angular_velocity": self.angular_velocity,
-            "tangential_velocity": self.tangential_velocity,
-            "centrifugal_acceleration": self.centrifugal_accel,
-            "unstable": self.unstable
-        }
-
-
-# ============================================================
-# 5. VACUUM CHAMBER MODEL
-# ============================================================
-
-class VacuumChamber:
-    def __init__(self, cfg):
-        self.pressure = cfg["initial_pressure_pa"]
-        self.base = cfg["base_pressure_pa"]
-        self.pump_speed = cfg["pump_speed"]
-        self.outgas = cfg["outgassing_rate"]
-
-    def step(self, dt):
-        pump_term = -self.pump_speed * (self.pressure - self.base)
-        outgas_term = self.outgas * math.log10(max(self.pressure, 1e-12) * 1e12 + 10.0)
-
-        self.pressure += (pump_term + outgas_term) * dt
-
-        if self.pressure < self.base:
-            self.pressure = self.base
-
-        return {"pressure_pa": self.pressure}
-
-
-# ============================================================
-# 6. EVENT GENERATION
-# ============================================================
-
-def generate_event(step, dt, beam, core_state, vacuum_state, ke_per_nucleon):
-    timestamp = datetime.utcnow().isoformat() + "Z"
-
-    z = beam["atomic_number"]
-    mass = beam["atomic_mass"]
-
-    total_energy = ke_per_nucleon * mass * 1e-9
-
-    avg_frag = max(2, min(10, int(z / 3)))
-    n = random.randint(max(2, avg_frag - 2), avg_frag + 2)
-
-    fragments = []
-    remaining = total_energy
-
-    for i in range(n):
-        if i == n - 1:
-            e = max(0.0, remaining)
-        else:
-            frac = random.uniform(0.05, 0.3)
-            e = total_energy * frac
-            remaining -= e
-
-        fragments.append({
-            "id": i,
-            "energy_j": e,
-            "angle_deg": random.uniform(0, 360)
-        })
-
-    return {
-        "timestamp": timestamp,
-        "step": step,
-        "time_delta": dt,
-        "beam_element": beam,
-        "centrifugal_state": core_state,
-        "vacuum_state": vacuum_state,
-        "fragments": fragments
-    }
-
-
-def save_event(event, outdir: Path):
-    ensure_directory(outdir)
-    ts = event["timestamp"].replace(":", "").replace("-", "").replace(".", "")
-    filename = f"event_{event['step']:06d}_{ts}.json"
-    path = outdir / filename
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(event, f, indent=2)
-    return path
-
-
-# ============================================================
-# 7. MAIN SIMULATION LOOP
-# ============================================================
-
-def run_simulation(elements, config):
-    sim = config["simulation"]
-    core_cfg = config["centrifugal"]
-    vac_cfg = config["vacuum"]
-    beam_cfg = config["beam"]
-    out_cfg = config["output"]
-
-    steps = sim["steps"]
-    dt = sim["time_step"]
-    interval = sim["event_interval_steps"]
-    delay = sim.get("realtime_delay", 0.0)
-
-    # Select beam element
-    beam = next(e for e in elements if e["atomic_number"] == beam_cfg["element_atomic_number"])
-
-    core = CentrifugalCore(core_cfg)
-    vacuum = VacuumChamber(vac_cfg)
-
-    events_dir = Path(out_cfg["events_dir"])
-    ensure_directory(events_dir)
-
-    print(f"[INFO] Beam element: {beam['symbol']} (Z={beam['atomic_number']})")
-    print(f"[INFO] Steps={steps}, dt={dt}, event_interval={interval}")
-
-    for step in range(steps):
-        core_state = core.step(dt)
-        vac_state = vacuum.step(dt)
-
-        if step % interval == 0 and step != 0:
-            event = generate_event(
-                step=step,
-                dt=dt,
-                beam=beam,
-                core_state=core_state,
-                vacuum_state=vac_state,
-                ke_per_nucleon=core.kinetic_energy_per_nucleon_j
-            )
-            path = save_event(event, events_dir)
-            print(f"[EVENT] step={step:04d} rpm={core_state['rpm']:8.1f} "
-                  f"P={vac_state['pressure_pa']:.3e} -> {path.name}")
-
-        if delay > 0:
-            time.sleep(delay)
-
-    print("[INFO] Simulation complete.")
-
-
-# ============================================================
-# 8. MAIN ENTRY POINT
-# ============================================================
-
-def main():
-    print("=== ecoAtom Facility Startup ===")
-
-    base = Path(__file__).resolve().parent
-    data_dir = base / "data"
-    config_path = data_dir / "config.json"
-    periodic_path = data_dir / "periodic_table.json"
-
-    config = load_json_or_default(config_path, DEFAULT_CONFIG)
-    elements = load_json_or_default(periodic_path, {"elements": DEFAULT_PERIODIC_TABLE})["elements"]
-
-    print("[OK] Configuration loaded")
-    print(f"[OK] Loaded {len(elements)} elements")
-
-    run_simulation(elements, config)
-
-
-if __name__ == "__main__":
-    main()